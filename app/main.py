@@ -1,12 +1,53 @@
+import asyncio
+import contextlib
+import logging
+import os
+from collections.abc import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 
 from app.core.config import DOCS_DIR, STATIC_DIR
 from app.routers import pipeline_router, presentation_router
+from app.services.pipeline_service import (
+    CARGO_FALLBACK_COMMAND,
+    create_pipeline_pool,
+    resolve_cesop_command,
+    run_cleanup_sweeper,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def check_cesop_command() -> None:
+    if tuple(resolve_cesop_command()) != CARGO_FALLBACK_COMMAND:
+        return
+    message = "cesop-demo binary not found; run `cargo build --release` or set CESOP_BIN"
+    if os.environ.get("CESOP_STRICT", "").lower() in {"1", "true", "yes"}:
+        raise RuntimeError(message)
+    logger.warning(
+        "%s. Falling back to `cargo run`; expect 100-500 ms overhead per stage.", message
+    )
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    app.state.pool = create_pipeline_pool()
+    app.state.pool_lock = asyncio.Lock()
+    sweeper = asyncio.create_task(run_cleanup_sweeper())
+    try:
+        yield
+    finally:
+        # Waiting for in-flight runs must not block the event loop.
+        await asyncio.to_thread(app.state.pool.shutdown, cancel_futures=True)
+        sweeper.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await sweeper
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="CESOP Pipeline Studio", version="0.1.0")
+    check_cesop_command()
+    app = FastAPI(title="CESOP Pipeline Studio", version="0.1.0", lifespan=lifespan)
     app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
     app.mount("/docs", StaticFiles(directory=str(DOCS_DIR)), name="docs")
     app.include_router(presentation_router)
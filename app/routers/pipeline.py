@@ -1,7 +1,11 @@
-from fastapi import APIRouter, HTTPException
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from fastapi import APIRouter, FastAPI, HTTPException, Request
 from pydantic import BaseModel
 
-from app.services.pipeline_service import run_pipeline
+from app.services.pipeline_service import create_pipeline_pool, run_pipeline
 
 router = APIRouter(prefix="/api", tags=["pipeline"])
 
@@ -11,13 +15,32 @@ class GenerateRequest(BaseModel):
 
 
 @router.post("/generate")
-def generate_sample(payload: GenerateRequest) -> dict:
+async def generate_sample(payload: GenerateRequest, request: Request) -> dict:
     if payload.scale <= 0:
         raise HTTPException(status_code=400, detail="Scale must be greater than 0")
     if payload.scale > 200_000:
         raise HTTPException(status_code=400, detail="Scale too large for demo")
 
-    try:
-        return run_pipeline(payload.scale)
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=str(exc)) from exc
+    loop = asyncio.get_running_loop()
+    # A pool worker that dies (e.g. OOM-killed) breaks the whole pool, so swap
+    # in a fresh one and retry once before giving up on this request.
+    for attempt in range(2):
+        pool = request.app.state.pool
+        try:
+            return await loop.run_in_executor(pool, run_pipeline, payload.scale)
+        except BrokenProcessPool as exc:
+            await replace_broken_pool(request.app, pool)
+            if attempt:
+                raise HTTPException(
+                    status_code=503, detail="Pipeline worker crashed; try again"
+                ) from exc
+        except Exception as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+
+async def replace_broken_pool(app: FastAPI, broken: ProcessPoolExecutor) -> None:
+    async with app.state.pool_lock:
+        # Concurrent requests on the same broken pool replace it only once.
+        if app.state.pool is broken:
+            app.state.pool = create_pipeline_pool()
+            broken.shutdown(wait=False, cancel_futures=True)
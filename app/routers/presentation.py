@@ -1,11 +1,23 @@
+import os
+
 from fastapi import APIRouter, Request
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
 
 from app.core.config import TEMPLATE_DIR
 
 router = APIRouter()
 
 templates = Jinja2Templates(directory=str(TEMPLATE_DIR))
+# Compiled templates are kept in Jinja's per-user cache dir (created 0700 and
+# ownership-checked) so a restart skips re-parsing them. Production runs
+# (CESOP_STRICT=1) also stop re-checking template sources on every render.
+templates.env.bytecode_cache = FileSystemBytecodeCache()
+templates.env.auto_reload = os.environ.get("CESOP_STRICT", "").lower() not in {
+    "1",
+    "true",
+    "yes",
+}
 
 
 @router.get("/", include_in_schema=False)
@@ -1,17 +1,31 @@
+import asyncio
+import atexit
 import csv
+import functools
+import itertools
+import json
+import logging
+import multiprocessing
+import operator
 import os
 import random
 import re
 import shutil
 import subprocess
+import sys
+import threading
 import time
-from threading import Timer
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 from app.core.config import CESOP_JAR, DATA_DIR, REPO_ROOT
 
-EU_MEMBER_STATES = [
+logger = logging.getLogger(__name__)
+
+EU_MEMBER_STATES = (
     "AT",
     "BE",
     "BG",
@@ -39,23 +53,64 @@ EU_MEMBER_STATES = [
     "SI",
     "ES",
     "SE",
-]
-EU_MEMBER_STATE_SET = set(EU_MEMBER_STATES)
+)
+EU_MEMBER_STATE_SET = frozenset(EU_MEMBER_STATES)
+# Rows kept per class (cross-border / not) for the raw and cross-border previews.
+SAMPLE_ROW_LIMIT = 8
+CLASSIFICATION_COLUMNS = (
+    "payee_id",
+    "payer_country",
+    "payee_account",
+    "payee_account_type",
+    "payee_psp_id",
+    "psp_role",
+)
+
 
+CARGO_FALLBACK_COMMAND = ("cargo", "run", "--quiet", "--")
 
+
+# The resolvers below probe the filesystem (and, for Java, spawn processes),
+# so results are cached per process, keyed by the environment values they read.
 def resolve_cesop_command() -> list[str]:
-    env_bin = os.environ.get("CESOP_BIN")
+    return list(cached_cesop_command(os.environ.get("CESOP_BIN")))
+
+
+@functools.lru_cache(maxsize=1)
+def cached_cesop_command(env_bin: str | None) -> tuple[str, ...]:
     if env_bin:
-        return [env_bin]
+        return (env_bin,)
 
     release_bin = REPO_ROOT / "target" / "release" / "cesop-demo"
     debug_bin = REPO_ROOT / "target" / "debug" / "cesop-demo"
     if release_bin.exists():
-        return [str(release_bin)]
+        return (str(release_bin),)
     if debug_bin.exists():
-        return [str(debug_bin)]
+        return (str(debug_bin),)
+
+    return CARGO_FALLBACK_COMMAND
+
 
-    return ["cargo", "run", "--quiet", "--"]
+def cesop_supports_stats_json() -> bool:
+    return cached_stats_json_support(cached_cesop_command(os.environ.get("CESOP_BIN")))
+
+
+@functools.lru_cache(maxsize=1)
+def cached_stats_json_support(cmd: tuple[str, ...]) -> bool:
+    # A binary built before `generate --stats-json` rejects the flag; the
+    # pipeline then summarizes the clean CSV itself.
+    try:
+        result = subprocess.run(
+            [*cmd, "generate", "--help"],
+            cwd=REPO_ROOT,
+            env=cesop_env(),
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except OSError:
+        return False
+    return "--stats-json" in result.stdout
 
 
 def resolve_cleanup_ttl_seconds() -> int:
@@ -66,6 +121,28 @@ def resolve_cleanup_ttl_seconds() -> int:
         return 300
 
 
+def resolve_pipeline_workers() -> int:
+    value = os.environ.get("CESOP_DEMO_WORKERS")
+    if value:
+        try:
+            return max(1, int(value))
+        except ValueError:
+            pass
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+
+def create_pipeline_pool() -> ProcessPoolExecutor:
+    # Pipeline runs are CPU-heavy Python plus several CLI stages, so they run
+    # in a shared process pool rather than on the event loop. "spawn" avoids
+    # forking the server's threads into the workers.
+    return ProcessPoolExecutor(
+        max_workers=resolve_pipeline_workers(),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
 def resolve_license_count(scale: int) -> int:
     value = os.environ.get("CESOP_DEMO_LICENSED_COUNT")
     if value:
@@ -89,67 +166,279 @@ def pick_licensed_countries(countries: list[str], desired: int) -> list[str]:
         return []
 
     selected: list[str] = []
+    seen: set[str] = set()
     for code in countries:
+        if len(selected) >= desired:
+            return selected
         if not code:
             continue
         normalized = code.strip().upper()
-        if normalized in EU_MEMBER_STATE_SET and normalized not in selected:
+        if normalized in EU_MEMBER_STATE_SET and normalized not in seen:
+            seen.add(normalized)
             selected.append(normalized)
 
-    if len(selected) < desired:
-        for code in EU_MEMBER_STATES:
-            if len(selected) >= desired:
-                break
-            if code not in selected:
-                selected.append(code)
+    for code in EU_MEMBER_STATES:
+        if len(selected) >= desired:
+            break
+        if code not in seen:
+            seen.add(code)
+            selected.append(code)
+
+    return selected
 
-    return selected[:desired]
+
+CLEANUP_MARKER = ".ttl"
+CLEANUP_SWEEP_SECONDS = 60
 
 
 def schedule_cleanup(target: Path, ttl_seconds: int) -> None:
     if ttl_seconds <= 0:
         return
+    # The app-wide sweeper removes the run once this expiry has passed.
+    (target / CLEANUP_MARKER).write_text(f"{time.time() + ttl_seconds:.0f}\n")
+
+
+def sweep_expired_runs() -> None:
+    now = time.time()
+    try:
+        root = DATA_DIR.resolve()
+        runs = list(root.iterdir())
+    except FileNotFoundError:
+        return
+    except OSError as exc:
+        logger.warning("Cleanup sweep skipped: cannot list %s: %s", DATA_DIR, exc)
+        return
 
-    def _cleanup() -> None:
+    for run in runs:
         try:
-            resolved = target.resolve()
-            root = DATA_DIR.resolve()
-            if root in resolved.parents and resolved.exists():
+            expires_at = float((run / CLEANUP_MARKER).read_text().strip())
+        except (OSError, ValueError):
+            continue
+        if expires_at > now:
+            continue
+        try:
+            resolved = run.resolve()
+            if root in resolved.parents:
                 shutil.rmtree(resolved)
         except Exception:
-            return
+            continue
+
 
-    timer = Timer(ttl_seconds, _cleanup)
-    timer.daemon = True
-    timer.start()
+async def run_cleanup_sweeper(interval_seconds: int = CLEANUP_SWEEP_SECONDS) -> None:
+    while True:
+        # One failed sweep must not end cleanup for the life of the process.
+        try:
+            await asyncio.to_thread(sweep_expired_runs)
+        except Exception:
+            logger.exception("Cleanup sweep failed")
+        await asyncio.sleep(interval_seconds)
 
 
-def run_cesop(args: list[str], allow_fail: bool = False) -> subprocess.CompletedProcess:
-    cmd = resolve_cesop_command()
+# Built once per process; pool workers are spawned, so each picks up the
+# environment as it was when the app started.
+@functools.lru_cache(maxsize=1)
+def cesop_env() -> Mapping[str, str]:
     env = os.environ.copy()
     env.setdefault("CESOP_LOG_DIR", "none")
     env.setdefault("CESOP_LOG_LEVEL", "info")
+    return env
+
+
+def check_cesop_result(
+    result: subprocess.CompletedProcess, allow_fail: bool
+) -> subprocess.CompletedProcess:
+    if result.returncode != 0 and not allow_fail:
+        message = result.stderr.strip() or result.stdout.strip() or "unknown error"
+        raise RuntimeError(f"Command failed: {' '.join(result.args)}\n{message}")
+    return result
+
 
+class CesopWorkerError(RuntimeError):
+    pass
+
+
+class CesopWorker:
+    def __init__(self, cmd: list[str]) -> None:
+        self.cmd = cmd
+        # Set once `serve` reports it is up; a worker that exits without it
+        # is a binary that has no serve mode.
+        self.ready = False
+        self.fallback_logged = False
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._pending: dict[int, tuple[list[str], Future]] = {}
+        self._closed = False
+        self._proc = subprocess.Popen(
+            cmd + ["serve"],
+            cwd=REPO_ROOT,
+            env=cesop_env(),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+        self._reader = threading.Thread(target=self._read_replies, daemon=True)
+        self._reader.start()
+
+    def submit(self, args: list[str]) -> Future:
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise CesopWorkerError("CESOP worker is not running")
+            request_id = next(self._ids)
+            self._pending[request_id] = (args, future)
+            try:
+                self._proc.stdin.write(json.dumps({"id": request_id, "args": args}) + "\n")
+                self._proc.stdin.flush()
+            except OSError as exc:
+                self._pending.pop(request_id, None)
+                raise CesopWorkerError("CESOP worker is not running") from exc
+        return future
+
+    def call(self, args: list[str]) -> subprocess.CompletedProcess:
+        return self.submit(args).result()
+
+    def close(self, timeout: float = 5.0) -> None:
+        with self._lock:
+            self._closed = True
+            try:
+                self._proc.stdin.close()
+            except OSError:
+                pass
+        # `serve` exits once stdin closes and in-flight requests finish.
+        try:
+            self._proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+            self._proc.wait()
+
+    def _read_replies(self) -> None:
+        for line in self._proc.stdout:
+            try:
+                reply = json.loads(line)
+            except ValueError:
+                continue
+            if reply.get("ready"):
+                self.ready = True
+                continue
+            with self._lock:
+                pending = self._pending.pop(reply.get("id"), None)
+            if pending is None:
+                continue
+            args, future = pending
+            future.set_result(
+                subprocess.CompletedProcess(
+                    self.cmd + args,
+                    reply.get("code", 1),
+                    reply.get("stdout", ""),
+                    reply.get("stderr", ""),
+                )
+            )
+
+        with self._lock:
+            self._closed = True
+            pending_items = list(self._pending.values())
+            self._pending.clear()
+        for _, future in pending_items:
+            future.set_exception(CesopWorkerError("CESOP worker exited"))
+
+
+@functools.lru_cache(maxsize=1)
+def get_cesop_worker() -> CesopWorker | None:
+    if os.environ.get("CESOP_WORKER", "").lower() in {"0", "false", "no"}:
+        return None
+    try:
+        return CesopWorker(resolve_cesop_command())
+    except OSError:
+        return None
+
+
+def handle_worker_crash(worker: CesopWorker) -> None:
+    if worker.ready:
+        # The serve loop was up and then died (e.g. killed mid-request), so
+        # start a fresh worker on the next call.
+        logger.warning("cesop-demo serve worker exited; restarting it on the next stage")
+        get_cesop_worker.cache_clear()
+        return
+    # Never came up: the binary has no `serve` mode. Keep the dead worker
+    # cached so later calls go straight to one process per stage.
+    if not worker.fallback_logged:
+        worker.fallback_logged = True
+        logger.warning(
+            "cesop-demo has no serve mode; running each stage as its own process "
+            "until the app restarts"
+        )
+
+
+@atexit.register
+def close_cesop_worker() -> None:
+    if not get_cesop_worker.cache_info().currsize:
+        return
+    worker = get_cesop_worker()
+    get_cesop_worker.cache_clear()
+    if worker is not None:
+        worker.close()
+
+
+def run_cesop(args: list[str], allow_fail: bool = False) -> subprocess.CompletedProcess:
+    worker = get_cesop_worker()
+    if worker is not None:
+        try:
+            return check_cesop_result(worker.call(args), allow_fail)
+        except CesopWorkerError:
+            handle_worker_crash(worker)
+
+    cmd = resolve_cesop_command()
     result = subprocess.run(
         cmd + args,
         cwd=REPO_ROOT,
-        env=env,
+        env=cesop_env(),
         capture_output=True,
         text=True,
         check=False,
     )
-    if result.returncode != 0 and not allow_fail:
-        message = result.stderr.strip() or result.stdout.strip() or "unknown error"
-        raise RuntimeError(f"Command failed: {' '.join(cmd + args)}\n{message}")
-    return result
+    return check_cesop_result(result, allow_fail)
+
+
+async def run_cesop_async(
+    args: list[str], allow_fail: bool = False
+) -> subprocess.CompletedProcess:
+    worker = get_cesop_worker()
+    if worker is not None:
+        try:
+            result = await asyncio.wrap_future(worker.submit(args))
+            return check_cesop_result(result, allow_fail)
+        except CesopWorkerError:
+            handle_worker_crash(worker)
+
+    cmd = resolve_cesop_command()
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        *args,
+        cwd=REPO_ROOT,
+        env=cesop_env(),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+    result = subprocess.CompletedProcess(
+        cmd + args,
+        proc.returncode,
+        stdout.decode(errors="replace"),
+        stderr.decode(errors="replace"),
+    )
+    return check_cesop_result(result, allow_fail)
 
 
 PREFLIGHT_RE = re.compile(r"Preflight issues: errors=(\d+) warnings=(\d+)")
 CORRECTED_RE = re.compile(r"Corrected records: (\d+) / (\d+)")
+COUNTRY_CODE_RE = re.compile(r"[A-Za-z]{2}")
+BIC_RE = re.compile(r"[A-Za-z0-9]{4}([A-Za-z]{2})[A-Za-z0-9]{2}(?:[A-Za-z0-9]{3})?")
+IBAN_LIKE_ACCOUNT_TYPES = frozenset(("IBAN", "OBAN", "OTHER"))
 
 
-def parse_preflight_summary(output: str) -> dict | None:
-    match = PREFLIGHT_RE.search(output)
+def parse_preflight_summary(stdout: str, stderr: str = "") -> dict | None:
+    match = PREFLIGHT_RE.search(stdout) or PREFLIGHT_RE.search(stderr)
     if not match:
         return None
     return {
@@ -158,8 +447,8 @@ def parse_preflight_summary(output: str) -> dict | None:
     }
 
 
-def parse_correct_summary(output: str) -> dict | None:
-    match = CORRECTED_RE.search(output)
+def parse_correct_summary(stdout: str, stderr: str = "") -> dict | None:
+    match = CORRECTED_RE.search(stdout) or CORRECTED_RE.search(stderr)
     if not match:
         return None
     return {
@@ -169,7 +458,11 @@ def parse_correct_summary(output: str) -> dict | None:
 
 
 def resolve_vm_jar() -> Path | None:
-    override = os.environ.get("CESOP_VM_JAR")
+    return cached_vm_jar(os.environ.get("CESOP_VM_JAR"))
+
+
+@functools.lru_cache(maxsize=1)
+def cached_vm_jar(override: str | None) -> Path | None:
     if override:
         jar_path = Path(override)
         return jar_path if jar_path.exists() else None
@@ -177,11 +470,17 @@ def resolve_vm_jar() -> Path | None:
 
 
 def resolve_java_bin() -> str | None:
-    override = os.environ.get("CESOP_JAVA_BIN") or os.environ.get("JAVA_BIN")
+    return cached_java_bin(
+        os.environ.get("CESOP_JAVA_BIN") or os.environ.get("JAVA_BIN"),
+        os.environ.get("JAVA_HOME"),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def cached_java_bin(override: str | None, java_home: str | None) -> str | None:
     if override:
         return validate_java_bin(override)
 
-    java_home = os.environ.get("JAVA_HOME")
     if java_home:
         candidate = Path(java_home) / "bin" / "java"
         resolved = validate_java_bin(str(candidate))
@@ -240,14 +539,89 @@ def read_csv_all(path: Path) -> tuple[list[str], list[list[str]]]:
     return header, rows
 
 
-def read_text_snippet(path: Path, max_lines: int = 14) -> str:
-    if not path.exists():
+def read_csv_columns(
+    path: Path, names: Sequence[str]
+) -> tuple[list[str], dict[str, list[str]], int]:
+    # Keeps only the named columns; the rest of each row is dropped as the
+    # reader advances, so memory scales with len(names) rather than the width
+    # of the file.
+    with path.open(newline="") as handle:
+        reader = csv.reader(handle)
+        header = next(reader, [])
+        column_index = build_column_index(header)
+        present = [name for name in names if name in column_index]
+        if not present:
+            return header, {}, sum(1 for _ in reader)
+        positions = [column_index[name] for name in present]
+        width = max(positions) + 1
+        pick = operator.itemgetter(*positions)
+        picked = []
+        for row in reader:
+            if len(row) < width:
+                row = row + [""] * (width - len(row))
+            picked.append(pick(row))
+    values = zip(*picked) if len(positions) > 1 else [picked]
+    columns: dict[str, list[str]] = {name: [] for name in present}
+    columns.update((name, list(column)) for name, column in zip(present, values))
+    return header, columns, len(picked)
+
+
+def read_csv_rows_at(path: Path, indices: Sequence[int]) -> dict[int, list[str]]:
+    wanted = set(indices)
+    rows: dict[int, list[str]] = {}
+    if not wanted:
+        return rows
+    last = max(wanted)
+    with path.open(newline="") as handle:
+        reader = csv.reader(handle)
+        next(reader, None)
+        for idx, row in enumerate(reader):
+            if idx in wanted:
+                rows[idx] = row
+            if idx >= last:
+                break
+    return rows
+
+
+def column_values(
+    columns: Mapping[str, Sequence[str]], name: str, row_count: int
+) -> Sequence[str]:
+    values = columns.get(name)
+    if values is None:
+        return ("",) * row_count
+    return values
+
+
+def read_text_snippet(path: Path, max_lines: int = 14, max_bytes: int = 4096) -> str:
+    # The previews only show the first few lines, so read a bounded prefix
+    # instead of walking a possibly large XML file line by line.
+    try:
+        with path.open("rb") as handle:
+            prefix = handle.read(max_bytes)
+    except FileNotFoundError:
         return ""
-    lines: list[str] = []
-    with path.open(encoding="utf-8") as handle:
-        for _, line in zip(range(max_lines), handle):
-            lines.append(line.rstrip("\n"))
-    return "\n".join(lines)
+    text = prefix.decode("utf-8", errors="replace")
+    return "\n".join(text.splitlines()[:max_lines])
+
+
+def file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+def list_xml_reports(output_dir: Path) -> list[Path]:
+    # One scandir pass; entries carry their file type, so no extra stat calls.
+    with os.scandir(output_dir) as entries:
+        names = [
+            entry.name
+            for entry in entries
+            if entry.name.endswith(".xml")
+            and entry.name != "validation.xml"
+            and entry.is_file()
+        ]
+    return [output_dir / name for name in sorted(names)]
 
 
 def extract_member_state(filename: str) -> str | None:
@@ -268,20 +642,15 @@ def safe_get(row: list[str], index: int | None) -> str:
 
 def normalize_country_code(value: str) -> str | None:
     trimmed = value.strip()
-    if len(trimmed) == 2 and trimmed.isalpha():
+    if COUNTRY_CODE_RE.fullmatch(trimmed):
         return trimmed.upper()
     return None
 
 
 def bic_country_code(value: str) -> str | None:
-    trimmed = value.strip()
-    if len(trimmed) not in (8, 11):
-        return None
-    if not trimmed.isalnum():
-        return None
-    code = trimmed[4:6]
-    if code.isalpha():
-        return code.upper()
+    match = BIC_RE.fullmatch(value.strip())
+    if match:
+        return match.group(1).upper()
     return None
 
 
@@ -290,46 +659,41 @@ def account_country_code(account_type: str, account_id: str) -> str | None:
     if not account_id:
         return None
     kind = account_type.strip().upper()
-    if kind in {"IBAN", "OBAN", "OTHER"}:
+    if kind in IBAN_LIKE_ACCOUNT_TYPES:
         return normalize_country_code(account_id[:2])
     if kind == "BIC":
         return bic_country_code(account_id)
     return None
 
 
-def resolve_payee_country(
-    row: list[str],
-    payee_account_idx: int | None,
-    payee_account_type_idx: int | None,
-    payee_psp_id_idx: int | None,
-) -> str:
-    account_type = safe_get(row, payee_account_type_idx)
-    account_id = safe_get(row, payee_account_idx)
+def resolve_payee_country(account_type: str, account_id: str, payee_psp_id: str) -> str:
     if account_id.strip():
         derived = account_country_code(account_type, account_id)
         if derived:
             return derived
-        payee_psp_id = safe_get(row, payee_psp_id_idx)
-        derived = bic_country_code(payee_psp_id)
-        if derived:
-            return derived
-        return ""
-    payee_psp_id = safe_get(row, payee_psp_id_idx)
-    derived = bic_country_code(payee_psp_id)
-    if derived:
-        return derived
-    return ""
-
-
-def reportable_for_psp(
-    row: list[str],
-    psp_role_idx: int | None,
-    payee_psp_id_idx: int | None,
-) -> bool:
-    role = safe_get(row, psp_role_idx).strip().upper() or "PAYEE"
+    return bic_country_code(payee_psp_id) or ""
+
+
+def resolve_payee_countries(columns: Mapping[str, Sequence[str]], row_count: int) -> list[str]:
+    # Interned so the handful of distinct codes share one object each, which
+    # keeps memory flat and makes the (payee_id, country) key hashing cheaper.
+    return list(
+        map(
+            sys.intern,
+            map(
+                resolve_payee_country,
+                column_values(columns, "payee_account_type", row_count),
+                column_values(columns, "payee_account", row_count),
+                column_values(columns, "payee_psp_id", row_count),
+            ),
+        )
+    )
+
+
+def reportable_for_psp(psp_role: str, payee_psp_id: str) -> bool:
+    role = psp_role.strip().upper() or "PAYEE"
     if role != "PAYER":
         return True
-    payee_psp_id = safe_get(row, payee_psp_id_idx)
     country = bic_country_code(payee_psp_id)
     if not country:
         return True
@@ -340,26 +704,22 @@ def build_column_index(header: list[str]) -> dict[str, int]:
     return {name: idx for idx, name in enumerate(header)}
 
 
-def compute_payee_count(rows: list[list[str]], payee_idx: int | None) -> int:
-    if payee_idx is None:
+def compute_payee_count(payee_ids: Sequence[str] | None) -> int:
+    if payee_ids is None:
         return 0
-    return len({row[payee_idx] for row in rows if len(row) > payee_idx})
+    # Short rows are padded with "" when the columns are read; a blank id is
+    # not a payee.
+    return len(set(payee_ids) - {""})
 
 
 def split_cross_border_indices(
-    rows: list[list[str]],
-    payer_country_idx: int | None,
+    payer_countries: Sequence[str],
     payee_countries: list[str],
 ) -> tuple[list[int], list[int]]:
     cross_border = []
     non_cross_border = []
-    if payer_country_idx is None:
-        return cross_border, list(range(len(rows)))
-
-    for idx, row in enumerate(rows):
-        payer_raw = safe_get(row, payer_country_idx)
+    for idx, (payer_raw, payee) in enumerate(zip(payer_countries, payee_countries)):
         payer = normalize_country_code(payer_raw) or ""
-        payee = payee_countries[idx] if idx < len(payee_countries) else ""
         if payer in EU_MEMBER_STATE_SET and payee and payer != payee:
             cross_border.append(idx)
         else:
@@ -368,30 +728,38 @@ def split_cross_border_indices(
 
 
 def compute_threshold_groups(
-    rows: list[list[str]],
     cross_border_indices: list[int],
-    payee_id_idx: int | None,
+    payee_ids: Sequence[str] | None,
     payee_countries: list[str],
-) -> tuple[dict[tuple[str, str], int], list[int]]:
-    if payee_id_idx is None:
-        return {}, []
-
-    counts: dict[tuple[str, str], int] = {}
-    for idx in cross_border_indices:
-        row = rows[idx]
-        payee_id = safe_get(row, payee_id_idx)
-        payee_country = payee_countries[idx] if idx < len(payee_countries) else ""
-        key = (payee_id, payee_country)
-        counts[key] = counts.get(key, 0) + 1
+    psp_roles: Sequence[str],
+    payee_psp_ids: Sequence[str],
+) -> tuple[dict[tuple[str, str], int], list[int], list[str]]:
+    if payee_ids is None:
+        return {}, [], []
+
+    # Select the cross-border keys once with map(__getitem__) (C-level
+    # indexing) and reuse them for both the count and the reportable pass.
+    keys = list(
+        zip(
+            map(payee_ids.__getitem__, cross_border_indices),
+            map(payee_countries.__getitem__, cross_border_indices),
+        )
+    )
+    counts: Counter[tuple[str, str]] = Counter(keys)
 
     eligible_keys = {key for key, count in counts.items() if count > 25}
-    eligible_indices = [
-        idx
-        for idx in cross_border_indices
-        if (safe_get(rows[idx], payee_id_idx), payee_countries[idx])
-        in eligible_keys
-    ]
-    return counts, eligible_indices
+    reportable_indices: list[int] = []
+    member_states: set[str] = set()
+    for idx, key in zip(cross_border_indices, keys):
+        if key not in eligible_keys:
+            continue
+        payee_country = key[1]
+        if not reportable_for_psp(psp_roles[idx], payee_psp_ids[idx]):
+            continue
+        reportable_indices.append(idx)
+        if payee_country:
+            member_states.add(payee_country)
+    return counts, reportable_indices, sorted(member_states)
 
 
 def diff_rows_for_indices(
@@ -408,13 +776,17 @@ def diff_rows_for_indices(
             continue
         clean = clean_rows[idx]
         corrupt = corrupt_rows[idx]
-        max_len = max(len(clean), len(corrupt))
-        row_diff_cols = []
-        for col in range(max_len):
-            left = clean[col] if col < len(clean) else ""
-            right = corrupt[col] if col < len(corrupt) else ""
-            if left != right:
-                row_diff_cols.append(col)
+        # Most rows are untouched; a whole-row compare skips them without a
+        # per-cell Python loop.
+        if clean == corrupt:
+            continue
+        row_diff_cols = [
+            col
+            for col, (left, right) in enumerate(
+                itertools.zip_longest(clean, corrupt, fillvalue="")
+            )
+            if left != right
+        ]
         if row_diff_cols:
             diff_row_count += 1
             diff_cells += len(row_diff_cols)
@@ -424,6 +796,81 @@ def diff_rows_for_indices(
     return diff_row_count, diff_cells, first_diff
 
 
+def classify_clean_csv(csv_path: Path) -> dict:
+    header, columns, row_count = read_csv_columns(csv_path, CLASSIFICATION_COLUMNS)
+    payee_ids = columns.get("payee_id")
+    payee_countries = resolve_payee_countries(columns, row_count)
+
+    cross_border_indices, non_cross_border_indices = split_cross_border_indices(
+        column_values(columns, "payer_country", row_count), payee_countries
+    )
+    threshold_counts, reportable_indices, reportable_member_states = compute_threshold_groups(
+        cross_border_indices,
+        payee_ids,
+        payee_countries,
+        column_values(columns, "psp_role", row_count),
+        column_values(columns, "payee_psp_id", row_count),
+    )
+    eligible = sorted(
+        ((key, count) for key, count in threshold_counts.items() if count > 25),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+    eligible_count = sum(count for _, count in eligible)
+    sample_indices = (
+        cross_border_indices[:SAMPLE_ROW_LIMIT] + non_cross_border_indices[:SAMPLE_ROW_LIMIT]
+    )
+
+    return {
+        "header": header,
+        "rows": row_count,
+        "payees": compute_payee_count(payee_ids),
+        "crossBorderIndices": cross_border_indices,
+        "nonCrossBorderIndices": non_cross_border_indices,
+        "reportableIndices": reportable_indices,
+        "belowThreshold": max(0, len(cross_border_indices) - eligible_count),
+        "reportablePayees": len(eligible),
+        "reportableMemberStates": reportable_member_states,
+        "thresholdGroups": [
+            (payee_id, payee_country, count) for (payee_id, payee_country), count in eligible
+        ],
+        "sampleRows": read_csv_rows_at(csv_path, sample_indices),
+    }
+
+
+def read_pipeline_stats(stats_path: Path) -> dict | None:
+    # Same shape as classify_clean_csv, decoded from `generate --stats-json`.
+    try:
+        with stats_path.open(encoding="utf-8") as handle:
+            payload = json.load(handle)
+        row_classes = payload["rowClasses"]
+        return {
+            "header": payload["header"],
+            "rows": payload["rows"],
+            "payees": payload["payees"],
+            "crossBorderIndices": [
+                idx for idx, row_class in enumerate(row_classes) if row_class != "N"
+            ],
+            "nonCrossBorderIndices": [
+                idx for idx, row_class in enumerate(row_classes) if row_class == "N"
+            ],
+            "reportableIndices": [
+                idx for idx, row_class in enumerate(row_classes) if row_class == "R"
+            ],
+            "belowThreshold": payload["belowThreshold"],
+            "reportablePayees": payload["reportablePayees"],
+            "reportableMemberStates": payload["reportableMemberStates"],
+            "thresholdGroups": [tuple(group) for group in payload["thresholdGroups"]],
+            "sampleRows": {sample["index"]: sample["row"] for sample in payload["sampleRows"]},
+        }
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def load_pipeline_stats(csv_path: Path, stats_path: Path) -> dict:
+    return read_pipeline_stats(stats_path) or classify_clean_csv(csv_path)
+
+
 def run_validation(output_dir: Path) -> dict:
     if os.environ.get("CESOP_SKIP_VALIDATION", "").lower() in {"1", "true", "yes"}:
         return {
@@ -490,6 +937,10 @@ def run_validation(output_dir: Path) -> dict:
 
 
 def run_pipeline(scale: int) -> dict:
+    return asyncio.run(run_pipeline_async(scale))
+
+
+async def run_pipeline_async(scale: int) -> dict:
     ttl_seconds = resolve_cleanup_ttl_seconds()
     psps = 1
     run_id = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
@@ -499,131 +950,128 @@ def run_pipeline(scale: int) -> dict:
     csv_path = run_dir / "payments.csv"
     corrupt_path = run_dir / "payments_invalid.csv"
     corrected_path = run_dir / "payments_corrected.csv"
+    stats_path = run_dir / "payments_stats.json"
     output_dir = run_dir / "output"
     output_dir.mkdir(parents=True, exist_ok=True)
 
     seed = random.randint(100000, 999999)
 
-    run_cesop(
-        [
-            "generate",
-            "--scale",
-            str(scale),
-            "--psps",
-            str(psps),
-            "--output",
-            str(csv_path),
-            "--seed",
-            str(seed),
-        ]
+    generate_args = [
+        "generate",
+        "--scale",
+        str(scale),
+        "--psps",
+        str(psps),
+        "--output",
+        str(csv_path),
+        "--seed",
+        str(seed),
+    ]
+    if await asyncio.to_thread(cesop_supports_stats_json):
+        generate_args += ["--stats-json", str(stats_path)]
+    await run_cesop_async(generate_args)
+
+    # Corrupting only needs the generated CSV, so let it run while the clean
+    # rows are summarized.
+    corrupt_task = asyncio.create_task(
+        run_cesop_async(
+            [
+                "corrupt",
+                "--input",
+                str(csv_path),
+                "--output",
+                str(corrupt_path),
+                "--seed",
+                str(seed),
+            ]
+        )
     )
 
-    clean_header, clean_rows = read_csv_all(csv_path)
-    header = clean_header
+    # The CLI summarizes the clean CSV itself; only parse it here when that
+    # summary is missing.
+    stats = await asyncio.to_thread(load_pipeline_stats, csv_path, stats_path)
+    header = stats["header"]
 
     column_index = build_column_index(header)
-    payee_id_idx = column_index.get("payee_id")
     payer_country_idx = column_index.get("payer_country")
     payer_ms_source_idx = column_index.get("payer_ms_source")
     payee_country_idx = column_index.get("payee_country")
     payee_name_idx = column_index.get("payee_name")
     payee_account_idx = column_index.get("payee_account")
     payee_account_type_idx = column_index.get("payee_account_type")
-    payee_psp_id_idx = column_index.get("payee_psp_id")
-    psp_role_idx = column_index.get("psp_role")
     currency_idx = column_index.get("currency")
 
-    payee_countries = [
-        resolve_payee_country(row, payee_account_idx, payee_account_type_idx, payee_psp_id_idx)
-        for row in clean_rows
-    ]
-
-    payees = compute_payee_count(clean_rows, payee_id_idx)
-    cross_border_indices, non_cross_border_indices = split_cross_border_indices(
-        clean_rows, payer_country_idx, payee_countries
-    )
-    cross_border_count = len(cross_border_indices)
-    non_cross_border_count = len(non_cross_border_indices)
-
-    threshold_counts, reportable_indices = compute_threshold_groups(
-        clean_rows, cross_border_indices, payee_id_idx, payee_countries
-    )
-    eligible_indices = sorted(reportable_indices)
-    reportable_indices = [
-        idx
-        for idx in eligible_indices
-        if reportable_for_psp(clean_rows[idx], psp_role_idx, payee_psp_id_idx)
-    ]
-    reportable_count = len(reportable_indices)
-    below_threshold_count = max(0, cross_border_count - len(eligible_indices))
-
-    eligible_keys = {key for key, count in threshold_counts.items() if count > 25}
-    reportable_payees = len(eligible_keys)
-    reportable_member_states = sorted(
-        {
-            payee_countries[idx]
-            for idx in reportable_indices
-            if payee_countries[idx]
-        }
-    )
+    sample_rows = stats["sampleRows"]
+    cross_border_indices = stats["crossBorderIndices"]
+    non_cross_border_indices = stats["nonCrossBorderIndices"]
+    reportable_indices = stats["reportableIndices"]
+    reportable_member_states = stats["reportableMemberStates"]
+    threshold_groups = stats["thresholdGroups"]
     licensed_countries = pick_licensed_countries(
         reportable_member_states, resolve_license_count(scale)
     )
 
-    run_cesop(
-        [
-            "corrupt",
-            "--input",
-            str(csv_path),
-            "--output",
-            str(corrupt_path),
-            "--seed",
-            str(seed),
-        ]
-    )
-    corrupt_preflight_result = run_cesop(
-        [
-            "preflight",
-            "--input",
-            str(corrupt_path),
-        ],
-        allow_fail=True,
+    await corrupt_task
+
+    async def run_correct_stages() -> tuple[
+        subprocess.CompletedProcess,
+        subprocess.CompletedProcess,
+        tuple[list[str], list[list[str]]],
+    ]:
+        correct_result = await run_cesop_async(
+            [
+                "correct",
+                "--input",
+                str(corrupt_path),
+                "--output",
+                str(corrected_path),
+                "--seed",
+                str(seed),
+            ]
+        )
+        render_args = ["render", "--input", str(corrected_path), "--output-dir", str(output_dir)]
+        if licensed_countries:
+            render_args += ["--licensed-countries", ",".join(licensed_countries)]
+        corrected_preflight_result, _, corrected_csv = await asyncio.gather(
+            run_cesop_async(
+                [
+                    "preflight",
+                    "--input",
+                    str(corrected_path),
+                ],
+                allow_fail=True,
+            ),
+            run_cesop_async(render_args),
+            asyncio.to_thread(read_csv_all, corrected_path),
+        )
+        return correct_result, corrected_preflight_result, corrected_csv
+
+    # Preflight of the corrupted CSV is independent of the correct -> render
+    # chain, so both run side by side.
+    (
+        corrupt_preflight_result,
+        (corrupt_header, corrupt_rows),
+        (correct_result, corrected_preflight_result, (corrected_header, corrected_rows)),
+    ) = await asyncio.gather(
+        run_cesop_async(
+            [
+                "preflight",
+                "--input",
+                str(corrupt_path),
+            ],
+            allow_fail=True,
+        ),
+        asyncio.to_thread(read_csv_all, corrupt_path),
+        run_correct_stages(),
     )
     corrupt_preflight = parse_preflight_summary(
-        f"{corrupt_preflight_result.stdout}\n{corrupt_preflight_result.stderr}"
-    )
-    correct_result = run_cesop(
-        [
-            "correct",
-            "--input",
-            str(corrupt_path),
-            "--output",
-            str(corrected_path),
-            "--seed",
-            str(seed),
-        ]
-    )
-    correct_summary = parse_correct_summary(
-        f"{correct_result.stdout}\n{correct_result.stderr}"
-    )
-    corrected_preflight_result = run_cesop(
-        [
-            "preflight",
-            "--input",
-            str(corrected_path),
-        ],
-        allow_fail=True,
+        corrupt_preflight_result.stdout, corrupt_preflight_result.stderr
     )
+    correct_summary = parse_correct_summary(correct_result.stdout, correct_result.stderr)
     corrected_preflight = parse_preflight_summary(
-        f"{corrected_preflight_result.stdout}\n{corrected_preflight_result.stderr}"
+        corrected_preflight_result.stdout, corrected_preflight_result.stderr
     )
-    render_args = ["render", "--input", str(corrected_path), "--output-dir", str(output_dir)]
-    if licensed_countries:
-        render_args += ["--licensed-countries", ",".join(licensed_countries)]
-    run_cesop(render_args)
 
-    corrupt_header, corrupt_rows = read_csv_all(corrupt_path)
-    corrected_header, corrected_rows = read_csv_all(corrected_path)
     if not header:
         header = corrupt_header
     if not header:
@@ -679,7 +1127,7 @@ def run_pipeline(scale: int) -> dict:
             preview_row_indices.append(idx)
 
     # Build the actual rows
-    raw_rows = [clean_rows[idx] for idx in preview_row_indices if idx < len(clean_rows)]
+    raw_rows = [sample_rows[idx] for idx in preview_row_indices if idx in sample_rows]
     cross_border_rows = raw_rows  # Same rows for both steps
 
     # Build highlights for the non-cross-border transactions with tooltips
@@ -696,13 +1144,8 @@ def run_pipeline(scale: int) -> dict:
             )
 
     threshold_summary_lines: list[str] = []
-    if eligible_keys:
-        ranked = sorted(
-            ((key, count) for key, count in threshold_counts.items() if count > 25),
-            key=lambda item: item[1],
-            reverse=True,
-        )
-        for (payee_id, payee_country), count in ranked[:max_preview_lines]:
+    if threshold_groups:
+        for payee_id, payee_country, count in threshold_groups[:max_preview_lines]:
             label = payee_id or "Unknown payee"
             country = payee_country or "--"
             threshold_summary_lines.append(f"{label} ({country}) -> {count} payments")
@@ -887,7 +1330,7 @@ def run_pipeline(scale: int) -> dict:
                 }
             )
 
-    xml_files = [path for path in sorted(output_dir.glob("*.xml")) if path.name != "validation.xml"]
+    xml_files = list_xml_reports(output_dir)
     xml_snippet = read_text_snippet(xml_files[0], max_lines=14) if xml_files else ""
     xml_member_states = sorted(
         {
@@ -909,14 +1352,14 @@ def run_pipeline(scale: int) -> dict:
 
     return {
         "seed": seed,
-        "rows": len(clean_rows),
-        "sizeBytes": csv_path.stat().st_size if csv_path.exists() else 0,
-        "payees": payees,
-        "crossBorder": cross_border_count,
-        "nonCrossBorder": non_cross_border_count,
-        "reportable": reportable_count,
-        "belowThreshold": below_threshold_count,
-        "reportablePayees": reportable_payees,
+        "rows": stats["rows"],
+        "sizeBytes": file_size(csv_path),
+        "payees": stats["payees"],
+        "crossBorder": len(cross_border_indices),
+        "nonCrossBorder": len(non_cross_border_indices),
+        "reportable": len(reportable_indices),
+        "belowThreshold": stats["belowThreshold"],
+        "reportablePayees": stats["reportablePayees"],
         "memberStates": len(member_state_codes),
         "memberStateCodes": member_state_codes,
         "errors": errors_count,
@@ -1,8 +1,49 @@
 use chrono::Local;
+use std::cell::RefCell;
 use std::path::PathBuf;
+use std::sync::atomic::{AtomicBool, Ordering};
 use std::sync::Once;
 
 static INIT: Once = Once::new();
+static STDOUT_RESERVED: AtomicBool = AtomicBool::new(false);
+
+thread_local! {
+    static CAPTURE: RefCell<Option<String>> = RefCell::new(None);
+}
+
+/// Route uncaptured output to stderr so stdout can carry a wire protocol.
+pub fn reserve_stdout() {
+    STDOUT_RESERVED.store(true, Ordering::SeqCst);
+}
+
+/// Start collecting output lines written on the current thread.
+pub fn begin_capture() {
+    CAPTURE.with(|capture| *capture.borrow_mut() = Some(String::new()));
+}
+
+/// Stop collecting output on the current thread and return what was written.
+pub fn end_capture() -> String {
+    CAPTURE.with(|capture| capture.borrow_mut().take().unwrap_or_default())
+}
+
+pub fn write_line(line: &str) {
+    let captured = CAPTURE.with(|capture| match capture.borrow_mut().as_mut() {
+        Some(buffer) => {
+            buffer.push_str(line);
+            buffer.push('\n');
+            true
+        }
+        None => false,
+    });
+    if captured {
+        return;
+    }
+    if STDOUT_RESERVED.load(Ordering::SeqCst) {
+        eprintln!("{line}");
+    } else {
+        println!("{line}");
+    }
+}
 
 pub fn init_logging(app_name: &str) -> Result<(), String> {
     let mut init_result: Result<(), String> = Ok(());
@@ -40,7 +81,7 @@ fn init_logging_inner(app_name: &str) -> Result<(), String> {
                 message
             ))
         })
-        .chain(std::io::stdout());
+        .chain(fern::Output::call(|record| write_line(&record.args().to_string())));
 
     if let Some(dir) = log_dir {
         std::fs::create_dir_all(&dir).map_err(|err| err.to_string())?;
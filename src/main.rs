@@ -8,6 +8,8 @@ mod logging;
 mod models;
 mod preflight;
 mod reference;
+mod serve;
+mod stats;
 mod util;
 mod validation;
 
@@ -40,6 +42,7 @@ enum Command {
     Corrupt(CorruptArgs),
     Preflight(PreflightArgs),
     Validate(ValidateArgs),
+    Serve,
 }
 
 #[derive(Parser)]
@@ -58,6 +61,8 @@ struct GenerateArgs {
     no_account_payee_ratio: f64,
     #[arg(long, default_value = "data/synthetic/payments.csv")]
     output: PathBuf,
+    #[arg(long)]
+    stats_json: Option<PathBuf>,
 }
 
 #[derive(Parser)]
@@ -141,7 +146,11 @@ fn main() {
 fn run() -> Result<(), String> {
     logging::init_logging("cesop-demo")?;
     let cli = Cli::parse();
-    match cli.command {
+    run_command(cli.command)
+}
+
+fn run_command(command: Command) -> Result<(), String> {
+    match command {
         Command::Generate(args) => run_generate(args),
         Command::Analyze(args) => run_analyze(args),
         Command::Render(args) => run_render(args),
@@ -149,9 +158,21 @@ fn run() -> Result<(), String> {
         Command::Corrupt(args) => run_corrupt(args),
         Command::Preflight(args) => run_preflight(args),
         Command::Validate(args) => run_validate(args),
+        Command::Serve => run_serve(),
     }
 }
 
+fn run_serve() -> Result<(), String> {
+    serve::serve(|args| {
+        let argv = std::iter::once("cesop-demo".to_string()).chain(args);
+        let cli = Cli::try_parse_from(argv).map_err(|err| err.to_string())?;
+        match cli.command {
+            Command::Serve => Err("serve cannot be nested".to_string()),
+            command => run_command(command),
+        }
+    })
+}
+
 fn run_generate(args: GenerateArgs) -> Result<(), String> {
     let (year, quarter) = resolve_year_quarter()?;
     let seed = args.seed.unwrap_or_else(random_seed);
@@ -222,6 +243,12 @@ fn run_generate(args: GenerateArgs) -> Result<(), String> {
         analysis_elapsed.as_millis()
     ));
 
+    if let Some(stats_path) = args.stats_json.as_deref() {
+        let stats = stats::write_stats_json(&args.output, stats_path)?;
+        emit_info_line(&stats.summary_line());
+        emit_info_line(&format!("Stats output: {}", stats_path.display()));
+    }
+
     Ok(())
 }
 
@@ -431,7 +458,7 @@ fn run_validate(args: ValidateArgs) -> Result<(), String> {
             output_path.display()
         ));
     } else {
-        println!("{}", result.stdout);
+        logging::write_line(&result.stdout);
     }
 
     if !result.stderr.trim().is_empty() {
@@ -582,6 +609,6 @@ fn emit_info_line(message: &str) {
     if log::log_enabled!(log::Level::Info) {
         log::info!("{}", message);
     } else {
-        println!("{message}");
+        logging::write_line(message);
     }
 }
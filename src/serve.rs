@@ -0,0 +1,83 @@
+use crate::logging;
+use serde::{Deserialize, Serialize};
+use std::io::{BufRead, Write};
+use std::panic::{catch_unwind, AssertUnwindSafe};
+use std::sync::Mutex;
+
+#[derive(Debug, Deserialize)]
+struct ServeRequest {
+    id: u64,
+    args: Vec<String>,
+}
+
+#[derive(Debug, Serialize)]
+struct ServeReply {
+    id: u64,
+    code: i32,
+    stdout: String,
+    stderr: String,
+}
+
+/// Read one JSON request per stdin line and answer each with one JSON line on
+/// stdout. Requests run on their own thread so independent commands overlap;
+/// replies carry the request id and may arrive out of order.
+pub fn serve<F>(handler: F) -> Result<(), String>
+where
+    F: Fn(Vec<String>) -> Result<(), String> + Sync,
+{
+    logging::reserve_stdout();
+    let handler = &handler;
+    let stdout = Mutex::new(std::io::stdout());
+    let stdout = &stdout;
+    let stdin = std::io::stdin();
+
+    // Tell the caller the serve loop is up before any request is read, so it
+    // can tell a worker that died mid-request from a binary without `serve`.
+    {
+        let mut out = stdout.lock().unwrap_or_else(|err| err.into_inner());
+        writeln!(out, "{{\"ready\":true}}").map_err(|err| err.to_string())?;
+        out.flush().map_err(|err| err.to_string())?;
+    }
+
+    std::thread::scope(|scope| {
+        for line in stdin.lock().lines() {
+            let line = line.map_err(|err| err.to_string())?;
+            if line.trim().is_empty() {
+                continue;
+            }
+            let request: ServeRequest = match serde_json::from_str(&line) {
+                Ok(request) => request,
+                Err(err) => {
+                    log::warn!("Ignoring malformed serve request: {err}");
+                    continue;
+                }
+            };
+
+            scope.spawn(move || {
+                logging::begin_capture();
+                let outcome = catch_unwind(AssertUnwindSafe(|| handler(request.args)));
+                let captured = logging::end_capture();
+                let (code, stderr) = match outcome {
+                    Ok(Ok(())) => (0, String::new()),
+                    Ok(Err(err)) => (1, format!("error: {err}")),
+                    Err(_) => (101, "error: command panicked".to_string()),
+                };
+                let reply = ServeReply {
+                    id: request.id,
+                    code,
+                    stdout: captured,
+                    stderr,
+                };
+                match serde_json::to_string(&reply) {
+                    Ok(encoded) => {
+                        let mut out = stdout.lock().unwrap_or_else(|err| err.into_inner());
+                        let _ = writeln!(out, "{encoded}");
+                        let _ = out.flush();
+                    }
+                    Err(err) => log::error!("Failed to encode serve reply: {err}"),
+                }
+            });
+        }
+        Ok(())
+    })
+}
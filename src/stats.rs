@@ -0,0 +1,253 @@
+// Summary stats for the Pipeline Studio demo. The rules here mirror the
+// classification in app/services/pipeline_service.py (which falls back to
+// computing them itself), so keep the two in sync.
+use crate::location::normalize_country_code;
+use crate::reference::is_eu_member_state;
+use csv::StringRecord;
+use serde::Serialize;
+use std::collections::{BTreeSet, HashMap, HashSet};
+use std::fs::create_dir_all;
+use std::io::BufWriter;
+use std::path::Path;
+
+const THRESHOLD: usize = 25;
+const SAMPLE_ROWS: usize = 8;
+
+#[derive(Debug, Serialize)]
+#[serde(rename_all = "camelCase")]
+pub struct PipelineStats {
+    header: Vec<String>,
+    rows: usize,
+    payees: usize,
+    cross_border: usize,
+    non_cross_border: usize,
+    reportable: usize,
+    below_threshold: usize,
+    reportable_payees: usize,
+    reportable_member_states: Vec<String>,
+    threshold_groups: Vec<(String, String, usize)>,
+    /// One character per data row: `N` not cross-border, `C` cross-border,
+    /// `R` cross-border and reportable.
+    row_classes: String,
+    sample_rows: Vec<SampleRow>,
+}
+
+#[derive(Debug, Serialize)]
+struct SampleRow {
+    index: usize,
+    row: Vec<String>,
+}
+
+impl PipelineStats {
+    pub fn summary_line(&self) -> String {
+        format!(
+            "Stats: rows={} cross_border={} reportable={} reportable_payees={}",
+            self.rows, self.cross_border, self.reportable, self.reportable_payees
+        )
+    }
+}
+
+pub fn write_stats_json(input: &Path, output: &Path) -> Result<PipelineStats, String> {
+    let stats = compute_stats(input)?;
+    if let Some(parent) = output.parent() {
+        create_dir_all(parent).map_err(|err| err.to_string())?;
+    }
+    let file = std::fs::File::create(output).map_err(|err| err.to_string())?;
+    serde_json::to_writer(BufWriter::new(file), &stats).map_err(|err| err.to_string())?;
+    Ok(stats)
+}
+
+fn compute_stats(input: &Path) -> Result<PipelineStats, String> {
+    let mut reader = csv::ReaderBuilder::new()
+        .flexible(true)
+        .from_path(input)
+        .map_err(|err| err.to_string())?;
+    let header: Vec<String> = reader
+        .headers()
+        .map_err(|err| err.to_string())?
+        .iter()
+        .map(str::to_string)
+        .collect();
+    let mut records: Vec<StringRecord> = Vec::new();
+    for result in reader.records() {
+        records.push(result.map_err(|err| err.to_string())?);
+    }
+
+    let column = |name: &str| header.iter().position(|value| value == name);
+    let payee_id_idx = column("payee_id");
+    let payer_country_idx = column("payer_country");
+    let payee_account_idx = column("payee_account");
+    let payee_account_type_idx = column("payee_account_type");
+    let payee_psp_id_idx = column("payee_psp_id");
+    let psp_role_idx = column("psp_role");
+
+    let mut classes = vec![b'N'; records.len()];
+    let mut payee_countries: Vec<String> = Vec::with_capacity(records.len());
+    let mut cross_border: Vec<usize> = Vec::new();
+    for (idx, record) in records.iter().enumerate() {
+        let payee_country = resolve_payee_country(
+            field(record, payee_account_type_idx),
+            field(record, payee_account_idx),
+            field(record, payee_psp_id_idx),
+        );
+        let payer = normalize_country_code(field(record, payer_country_idx)).unwrap_or_default();
+        if is_eu_member_state(&payer) && !payee_country.is_empty() && payer != payee_country {
+            classes[idx] = b'C';
+            cross_border.push(idx);
+        }
+        payee_countries.push(payee_country);
+    }
+
+    let payees = match payee_id_idx {
+        Some(_) => records
+            .iter()
+            .map(|record| field(record, payee_id_idx))
+            .filter(|payee_id| !payee_id.is_empty())
+            .collect::<HashSet<&str>>()
+            .len(),
+        None => 0,
+    };
+
+    // Groups keep first-seen order so ties rank the same way as in Python.
+    let mut group_order: Vec<(String, String)> = Vec::new();
+    let mut counts: HashMap<(String, String), usize> = HashMap::new();
+    if payee_id_idx.is_some() {
+        for &idx in &cross_border {
+            let key = (
+                field(&records[idx], payee_id_idx).to_string(),
+                payee_countries[idx].clone(),
+            );
+            match counts.get_mut(&key) {
+                Some(count) => *count += 1,
+                None => {
+                    group_order.push(key.clone());
+                    counts.insert(key, 1);
+                }
+            }
+        }
+    }
+
+    let mut reportable = 0usize;
+    let mut member_states: BTreeSet<String> = BTreeSet::new();
+    for &idx in &cross_border {
+        let record = &records[idx];
+        let key = (
+            field(record, payee_id_idx).to_string(),
+            payee_countries[idx].clone(),
+        );
+        if counts.get(&key).map_or(true, |count| *count <= THRESHOLD) {
+            continue;
+        }
+        if !reportable_for_psp(field(record, psp_role_idx), field(record, payee_psp_id_idx)) {
+            continue;
+        }
+        classes[idx] = b'R';
+        reportable += 1;
+        if !payee_countries[idx].is_empty() {
+            member_states.insert(payee_countries[idx].clone());
+        }
+    }
+
+    let mut threshold_groups: Vec<(String, String, usize)> = group_order
+        .into_iter()
+        .filter_map(|key| {
+            let count = counts[&key];
+            if count > THRESHOLD {
+                Some((key.0, key.1, count))
+            } else {
+                None
+            }
+        })
+        .collect();
+    threshold_groups.sort_by(|a, b| b.2.cmp(&a.2));
+    let eligible_records: usize = threshold_groups.iter().map(|group| group.2).sum();
+
+    let non_cross_border = classes.iter().filter(|class| **class == b'N').count();
+    let sample_indices = classes
+        .iter()
+        .enumerate()
+        .filter(|(_, class)| **class != b'N')
+        .map(|(idx, _)| idx)
+        .take(SAMPLE_ROWS)
+        .chain(
+            classes
+                .iter()
+                .enumerate()
+                .filter(|(_, class)| **class == b'N')
+                .map(|(idx, _)| idx)
+                .take(SAMPLE_ROWS),
+        );
+    let sample_rows = sample_indices
+        .map(|idx| SampleRow {
+            index: idx,
+            row: records[idx].iter().map(str::to_string).collect(),
+        })
+        .collect();
+
+    Ok(PipelineStats {
+        rows: records.len(),
+        header,
+        payees,
+        cross_border: cross_border.len(),
+        non_cross_border,
+        reportable,
+        below_threshold: cross_border.len().saturating_sub(eligible_records),
+        reportable_payees: threshold_groups.len(),
+        reportable_member_states: member_states.into_iter().collect(),
+        threshold_groups,
+        row_classes: classes.iter().map(|class| *class as char).collect(),
+        sample_rows,
+    })
+}
+
+fn field(record: &StringRecord, idx: Option<usize>) -> &str {
+    idx.and_then(|idx| record.get(idx)).unwrap_or("")
+}
+
+// Stricter than location::bic_country_code: the whole BIC must be ASCII
+// alphanumeric, matching the Python BIC_RE pattern.
+fn bic_country(value: &str) -> Option<String> {
+    let bic = value.trim();
+    if !(bic.len() == 8 || bic.len() == 11) || !bic.bytes().all(|b| b.is_ascii_alphanumeric()) {
+        return None;
+    }
+    let code = &bic[4..6];
+    if code.bytes().all(|b| b.is_ascii_alphabetic()) {
+        Some(code.to_ascii_uppercase())
+    } else {
+        None
+    }
+}
+
+fn account_country(account_type: &str, account_id: &str) -> Option<String> {
+    let account_id = account_id.trim();
+    if account_id.is_empty() {
+        return None;
+    }
+    match account_type.trim().to_uppercase().as_str() {
+        "IBAN" | "OBAN" | "OTHER" => {
+            normalize_country_code(&account_id.chars().take(2).collect::<String>())
+        }
+        "BIC" => bic_country(account_id),
+        _ => None,
+    }
+}
+
+fn resolve_payee_country(account_type: &str, account_id: &str, payee_psp_id: &str) -> String {
+    if !account_id.trim().is_empty() {
+        if let Some(country) = account_country(account_type, account_id) {
+            return country;
+        }
+    }
+    bic_country(payee_psp_id).unwrap_or_default()
+}
+
+fn reportable_for_psp(psp_role: &str, payee_psp_id: &str) -> bool {
+    if psp_role.trim().to_uppercase() != "PAYER" {
+        return true;
+    }
+    match bic_country(payee_psp_id) {
+        Some(country) => !is_eu_member_state(&country),
+        None => true,
+    }
+}